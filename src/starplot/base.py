@@ -10,10 +10,9 @@ from matplotlib import patches
 from matplotlib import pyplot as plt, patheffects, transforms
 from matplotlib.lines import Line2D
 from pytz import timezone
-from skyfield.api import Angle
 
-from starplot import geod
-from starplot.data import load, ecliptic
+from starplot import geod, utils
+from starplot.data import ecliptic, load_ephemeris, load_timescale
 from starplot.data.planets import Planet, get_planet_positions, PLANET_LABELS_DEFAULT
 from starplot.styles import (
     PlotStyle,
@@ -67,7 +66,7 @@ class BasePlot(ABC):
         self.hide_colliding_labels = hide_colliding_labels
 
         self.dt = dt or timezone("UTC").localize(datetime.now())
-        self.ephemeris = load(ephemeris)
+        self.ephemeris = load_ephemeris(ephemeris)
 
         self.labels = []
         self._labels_rtree = rtree.index.Index()
@@ -84,7 +83,7 @@ class BasePlot(ABC):
             foreground=self.style.background_color.as_hex(),
         )
         self._size_multiplier = self.resolution / 3000
-        self.timescale = load.timescale().from_datetime(self.dt)
+        self.timescale = load_timescale().from_datetime(self.dt)
 
     def _plot_kwargs(self) -> dict:
         return {}
@@ -259,33 +258,43 @@ class BasePlot(ABC):
             legend_label: How to label the marker in the legend. If `None`, then the marker will not be added to the legend
 
         """
-        x, y = self._prepare_coords(ra, dec)
-
         if self.in_bounds(ra, dec):
-            self.ax.plot(
-                x,
-                y,
-                **style.marker.matplot_kwargs(size_multiplier=self._size_multiplier),
-                **self._plot_kwargs(),
-                linestyle="None",
-            )
+            self._markers([ra], [dec], style.marker)
 
             if legend_label is not None:
                 self._add_legend_handle_marker(legend_label, style.marker)
 
             if label:
-                plotted_label = self.ax.text(
-                    x,
-                    y,
-                    label,
-                    **style.label.matplot_kwargs(size_multiplier=self._size_multiplier),
-                    **self._plot_kwargs(),
-                    path_effects=[self.text_border],
-                    va="bottom",
-                    ha="left",
-                )
-                plotted_label.set_clip_on(True)
-                self._maybe_remove_label(plotted_label)
+                self._marker_label(ra, dec, label, style.label)
+
+    def _markers(self, ras: list, decs: list, style: MarkerStyle) -> None:
+        """Plots markers that all have the same style, with a single call to matplotlib (does nothing if there are no coordinates)"""
+        if not len(ras):
+            return
+
+        x, y = zip(*[self._prepare_coords(ra, dec) for ra, dec in zip(ras, decs)])
+        self.ax.plot(
+            x,
+            y,
+            **style.matplot_kwargs(size_multiplier=self._size_multiplier),
+            **self._plot_kwargs(),
+            linestyle="None",
+        )
+
+    def _marker_label(self, ra: float, dec: float, label: str, style: LabelStyle):
+        x, y = self._prepare_coords(ra, dec)
+        plotted_label = self.ax.text(
+            x,
+            y,
+            label,
+            **style.matplot_kwargs(size_multiplier=self._size_multiplier),
+            **self._plot_kwargs(),
+            path_effects=[self.text_border],
+            va="bottom",
+            ha="left",
+        )
+        plotted_label.set_clip_on(True)
+        self._maybe_remove_label(plotted_label)
 
     @use_style(ObjectStyle, "planets")
     def planets(
@@ -363,9 +372,9 @@ class BasePlot(ABC):
 
         if true_size:
             radius_km = 1_740
-            apparent_diameter_degrees = Angle(
-                radians=np.arcsin(radius_km / distance.km) * 2.0
-            ).degrees
+            apparent_diameter_degrees = utils.apparent_diameter_degrees(
+                radius_km, distance.km
+            )
 
             self.circle(
                 (ra, dec),
@@ -406,6 +415,12 @@ class BasePlot(ABC):
         """
         raise NotImplementedError
 
+    def _in_bounds_mask(self, ras: np.ndarray, decs: np.ndarray) -> np.ndarray:
+        """Returns a boolean array of which coordinates are within the bounds of the plot"""
+        return np.array(
+            [self.in_bounds(ra, dec) for ra, dec in zip(ras, decs)], dtype=bool
+        )
+
     def _polygon(self, points: list, style: PolygonStyle, **kwargs):
         points = [geod.to_radec(p) for p in points]
         points = [self._prepare_coords(*p) for p in points]
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 from skyfield.api import Loader
@@ -9,6 +10,18 @@ DATA_PATH = HERE / "library"
 load = Loader(DATA_PATH)
 
 
+@lru_cache(maxsize=4)
+def load_ephemeris(name: str):
+    """Returns the ephemeris file, which is only loaded once per filename"""
+    return load(name)
+
+
+@lru_cache(maxsize=1)
+def load_timescale():
+    """Returns Skyfield's timescale, which is only built once"""
+    return load.timescale()
+
+
 class DataFiles(str, Enum):
     CONSTELLATION_LINES = DATA_PATH / "constellation_lines_inv.gpkg"
     CONSTELLATION_LINES_HIP = DATA_PATH / "constellation_lines_hips.json"
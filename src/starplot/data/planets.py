@@ -1,9 +1,14 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Dict
 
 import numpy as np
 
 from skyfield.api import Angle
+from skyfield.functions import to_spherical
+from skyfield.units import Distance
+
+from starplot.utils import apparent_diameter_degrees
 
 
 class Planet(str, Enum):
@@ -37,23 +42,36 @@ https://science.nasa.gov/resource/solar-system-sizes/
 Retrieved on 28-Jan-2024
 """
 
+_PLANET_RADII_KM = np.array([PLANET_SIZE_KM[p] for p in Planet])
+
+
+@lru_cache(maxsize=4)
+def _get_bodies(ephemeris) -> tuple:
+    """Returns the earth and planet bodies (in the same order as `Planet`) of an ephemeris"""
+    earth = ephemeris["earth"]
+    planets = [ephemeris[f"{p.value} barycenter"] for p in Planet]
+    return earth, planets
+
 
 def get_planet_positions(timescale, ephemeris) -> Dict[Planet, tuple]:
     result = {}
-    earth = ephemeris["earth"]
+    earth, planets = _get_bodies(ephemeris)
+
+    # observe all planets from the same observer position, and then convert
+    # the astrometric positions to RA/DEC in a single vectorized pass
+    observer = earth.at(timescale)
+    positions_au = np.column_stack(
+        [observer.observe(planet).position.au for planet in planets]
+    )
+    distances_au, decs, ras = to_spherical(positions_au)
 
-    for p in Planet:
-        planet = ephemeris[f"{p.value} barycenter"]
-        astrometric = earth.at(timescale).observe(planet)
-        ra, dec, distance = astrometric.radec()
+    ras_hours = Angle(radians=ras, preference="hours").hours
+    decs_degrees = Angle(radians=decs).degrees
+    distances_km = Distance(au=distances_au).km
 
-        # angular diameter:
-        # https://rhodesmill.org/skyfield/examples.html#what-is-the-angular-diameter-of-a-planet-given-its-radius
-        radius_km = PLANET_SIZE_KM[p]
-        apparent_diameter_degrees = Angle(
-            radians=np.arcsin(radius_km / distance.km) * 2.0
-        ).degrees
+    diameters_degrees = apparent_diameter_degrees(_PLANET_RADII_KM, distances_km)
 
-        result[p] = (ra.hours, dec.degrees, apparent_diameter_degrees)
+    for i, p in enumerate(Planet):
+        result[p] = (ras_hours[i], decs_degrees[i], diameters_degrees[i])
 
     return result
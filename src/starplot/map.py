@@ -154,6 +154,15 @@ class MapPlot(BasePlot, ExtentMaskMixin, StarPlotterMixin, DsoPlotterMixin):
                 ra > self.ra_min or ra < self.ra_max - 24
             ) and self.dec_min < dec < self.dec_max
 
+    def _in_bounds_mask(self, ras: np.ndarray, decs: np.ndarray) -> np.ndarray:
+        # vectorized version of in_bounds
+        in_dec_bounds = (self.dec_min < decs) & (decs < self.dec_max)
+
+        if self.ra_max < 24:
+            return (self.ra_min < ras) & (ras < self.ra_max) & in_dec_bounds
+        else:
+            return ((ras > self.ra_min) | (ras < self.ra_max - 24)) & in_dec_bounds
+
     def _polygon(self, points, style, **kwargs):
         super()._polygon(points, style, transform=self._crs, **kwargs)
 
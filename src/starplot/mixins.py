@@ -2,12 +2,24 @@ from shapely import Polygon, MultiPolygon
 
 
 class ExtentMaskMixin:
+    _extent_mask_cache = None
+
     def _extent_mask(self):
         """
         Returns shapely geometry objects of extent (RA = 0...360)
 
         If the extent crosses equinox, then two Polygons will be returned
+
+        The geometry is cached, and only created again if the RA/DEC extent changes
         """
+        extent = (self.ra_min, self.ra_max, self.dec_min, self.dec_max)
+
+        if self._extent_mask_cache is None or self._extent_mask_cache[0] != extent:
+            self._extent_mask_cache = (extent, self._create_extent_mask())
+
+        return self._extent_mask_cache[1]
+
+    def _create_extent_mask(self):
         if self.ra_max < 24:
             coords = [
                 [self.ra_min * 15, self.dec_min],
@@ -2,6 +2,7 @@ from typing import Mapping
 
 import geopandas as gpd
 import numpy as np
+from shapely import Polygon, MultiPolygon
 
 from starplot.data import DataFiles
 from starplot.data.dsos import (
@@ -13,16 +14,20 @@ from starplot.data.dsos import (
     DSO_LABELS_DEFAULT,
     DsoLabelMaker,
 )
-from starplot.styles import MarkerSymbolEnum
+from starplot.styles import MarkerSymbolEnum, PolygonStyle
+
+
+def _sql_values(values: list) -> str:
+    """Returns a comma-separated string of quoted values, for use in a SQL IN clause"""
+    return ",".join("'" + str(v).replace("'", "''") + "'" for v in values)
 
 
 class DsoPlotterMixin:
-    def _plot_dso_polygon(self, polygon, style):
-        coords = list(zip(*polygon.exterior.coords.xy))
+    def _plot_dso_polygon(self, polygon, style: PolygonStyle):
+        coords = np.asarray(polygon.exterior.coords)
         # close the polygon - for some reason matplotlib needs the coord twice
-        coords.append(coords[0])
-        coords.append(coords[0])
-        self._polygon(coords, style.marker.to_polygon_style(), closed=False)
+        coords = np.vstack([coords, coords[:1], coords[:1]])
+        self._polygon(coords, style, closed=False)
 
     def open_clusters(self, *args, **kwargs):
         self.dsos(types=[DsoType.OPEN_CLUSTER], **kwargs)
@@ -87,14 +92,33 @@ class DsoPlotterMixin:
 
         # TODO: add args mag_labels, styles
 
-        # TODO: sort by type, and plot markers together (for better performance)
-
         self.logger.debug("Plotting DSOs...")
-        ongc = gpd.read_file(
+
+        if not types:
+            return
+
+        # filter by type and magnitude (V-Mag, or B-Mag if no V-Mag) while reading the file,
+        # so excluded DSOs are never loaded
+        dso_types = [ONGC_TYPE[dtype] for dtype in types]
+        b_mag_filter = f'"B-Mag" <= {mag}'
+
+        if null:
+            b_mag_filter += ' OR "B-Mag" IS NULL'
+
+        filters = [
+            f'"Type" IN ({_sql_values(dso_types)})',
+            f'("V-Mag" <= {mag} OR ("V-Mag" IS NULL AND ({b_mag_filter})))',
+        ]
+
+        if names:
+            filters.append(f'"Name" IN ({_sql_values(names)})')
+
+        nearby_dsos = gpd.read_file(
             DataFiles.ONGC.value,
             engine="pyogrio",
             use_arrow=True,
             bbox=self._extent_mask(),
+            where=" AND ".join(filters),
         )
 
         if labels is None:
@@ -107,45 +131,71 @@ class DsoPlotterMixin:
         else:
             legend_labels = {**DSO_LEGEND_LABELS, **legend_labels}
 
-        dso_types = [ONGC_TYPE[dtype] for dtype in types]
-        nearby_dsos = ongc[ongc["Type"].isin(dso_types)]
-        nearby_dsos = nearby_dsos.replace({np.nan: None})
-
-        if names:
-            nearby_dsos = nearby_dsos[nearby_dsos["Name"].isin(names)]
-
-        for n, d in nearby_dsos.iterrows():
-            if d.ra_degrees is None or d.dec_degrees is None:
-                continue
-
-            ra = d.ra_degrees
-            dec = d.dec_degrees
-
-            name = d.Name
-            label = labels.get(name)
-            dso_type = ONGC_TYPE_MAP[d.Type]
-            style = self.style.get_dso_style(dso_type)
-            maj_ax, min_ax, angle = d.MajAx, d.MinAx, d.PosAng
+        # pull out the columns once, so we don't have to build a Series for every row
+        # (unknown sizes and angles are set to 0)
+        ra_hours = nearby_dsos["ra_degrees"].to_numpy() / 15
+        dec_degrees = nearby_dsos["dec_degrees"].to_numpy()
+        maj_axes = np.nan_to_num(nearby_dsos["MajAx"].to_numpy())
+        min_axes = np.nan_to_num(nearby_dsos["MinAx"].to_numpy())
+        angles = np.nan_to_num(nearby_dsos["PosAng"].to_numpy())
+        dso_names = nearby_dsos["Name"].to_numpy()
+        geometries = nearby_dsos.geometry.values
+
+        # encode each row's type as an index into the unique OpenNGC types,
+        # so the type mapping is only done once for each type instead of every row
+        ongc_types, type_indices = np.unique(
+            nearby_dsos["Type"].to_numpy(), return_inverse=True
+        )
+        types_by_index = [ONGC_TYPE_MAP[t] for t in ongc_types]
+
+        # styles only depend on the DSO type, so just get them once for each type
+        dso_styles = {
+            dso_type: self.style.get_dso_style(dso_type) for dso_type in types_by_index
+        }
+        polygon_styles = {
+            dso_type: style.marker.to_polygon_style()
+            for dso_type, style in dso_styles.items()
+            if style
+        }
+        label_kwargs = {
+            dso_type: style.label.matplot_kwargs(self._size_multiplier)
+            for dso_type, style in dso_styles.items()
+            if style
+        }
+
+        # skip DSOs without coordinates or a style, before iterating
+        has_style = np.array([bool(dso_styles[t]) for t in types_by_index], dtype=bool)
+        plotted = ~np.isnan(ra_hours) & ~np.isnan(dec_degrees) & has_style[type_indices]
+
+        # DSOs are only plotted as markers if they're within the bounds of the plot
+        in_bounds = np.zeros(len(plotted), dtype=bool)
+
+        if not true_size:
+            in_bounds[plotted] = self._in_bounds_mask(
+                ra_hours[plotted], dec_degrees[plotted]
+            )
+
+        markers = {}
+        marker_labels = []
+
+        for i in np.flatnonzero(plotted):
+            ra = ra_hours[i]
+            dec = dec_degrees[i]
+            dso_type = types_by_index[type_indices[i]]
+            style = dso_styles[dso_type]
+            label = labels.get(dso_names[i])
+            maj_ax, min_ax, angle = maj_axes[i], min_axes[i], angles[i]
             legend_label = legend_labels.get(dso_type)
-            magnitude = d["V-Mag"] or d["B-Mag"] or None
-            magnitude = float(magnitude) if magnitude else None
 
-            if (
-                not style
-                or (magnitude is not None and magnitude > mag)
-                or (magnitude is None and not null)
-            ):
-                continue
-
-            geometry_types = d["geometry"].geom_type
+            geometry = geometries[i]
 
             if true_size:
-                if "Polygon" in geometry_types and "MultiPolygon" not in geometry_types:
-                    self._plot_dso_polygon(d.geometry, style)
+                if isinstance(geometry, Polygon):
+                    self._plot_dso_polygon(geometry, polygon_styles[dso_type])
 
-                elif "MultiPolygon" in geometry_types:
-                    for polygon in d.geometry.geoms:
-                        self._plot_dso_polygon(polygon, style)
+                elif isinstance(geometry, MultiPolygon):
+                    for polygon in geometry.geoms:
+                        self._plot_dso_polygon(polygon, polygon_styles[dso_type])
                 elif maj_ax:
                     # if object has a major axis then plot its actual extent
 
@@ -156,40 +206,47 @@ class DsoPlotterMixin:
                     else:
                         min_ax_degrees = maj_ax_degrees
 
-                    poly_style = style.marker.to_polygon_style()
+                    poly_style = polygon_styles[dso_type]
 
                     if style.marker.symbol == MarkerSymbolEnum.SQUARE:
                         self.rectangle(
-                            (ra / 15, dec),
+                            (ra, dec),
                             min_ax_degrees * 2,
                             maj_ax_degrees * 2,
                             poly_style,
-                            angle or 0,
+                            angle,
                         )
                     else:
                         self.ellipse(
-                            (ra / 15, dec),
+                            (ra, dec),
                             min_ax_degrees * 2,
                             maj_ax_degrees * 2,
                             poly_style,
-                            angle or 0,
+                            angle,
                         )
 
                 if label:
                     self._plot_text(
-                        ra / 15,
+                        ra,
                         dec,
                         label,
-                        **style.label.matplot_kwargs(self._size_multiplier),
+                        **label_kwargs[dso_type],
                     )
 
-            else:
+            elif in_bounds[i]:
                 # if no major axis, then just plot as a marker
-                self.marker(
-                    ra=ra / 15,
-                    dec=dec,
-                    label=label,
-                    style=style,
-                )
-
-            self._add_legend_handle_marker(legend_label, style.marker)
+                markers.setdefault(dso_type, []).append((ra, dec))
+
+                if label:
+                    marker_labels.append((ra, dec, label, style.label))
+
+            if legend_label not in self._legend_handles:
+                self._add_legend_handle_marker(legend_label, style.marker)
+
+        # plot markers of the same type together, and then their labels
+        for dso_type, points in markers.items():
+            ras, decs = zip(*points)
+            self._markers(ras, decs, dso_styles[dso_type].marker)
+
+        for ra, dec, label, label_style in marker_labels:
+            self._marker_label(ra, dec, label, label_style)
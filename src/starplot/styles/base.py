@@ -236,7 +236,7 @@ class LineStyle(BaseStyle):
         ```
     """
 
-    width: float = 2
+    width: float = 2.0
     """Width of line"""
 
     color: ColorStr = ColorStr("#000")
@@ -343,7 +343,7 @@ class LabelStyle(BaseStyle):
     font_color: ColorStr = ColorStr("#000")
     """Font's color"""
 
-    font_alpha: float = 1
+    font_alpha: float = 1.0
     """Font's alpha (transparency)"""
 
     font_style: FontStyleEnum = FontStyleEnum.NORMAL
@@ -1,5 +1,3 @@
-import json
-
 from functools import wraps
 
 
@@ -13,11 +11,17 @@ def merge_dict(dict_1: dict, dict_2: dict) -> None:
     Returns:
         None (dict_1 is modified directly)
     """
-    for k in dict_2.keys():
-        if k in dict_1 and isinstance(dict_1[k], dict) and isinstance(dict_2[k], dict):
-            merge_dict(dict_1[k], dict_2[k])
-        else:
-            dict_1[k] = dict_2[k]
+    stack = [(dict_1, dict_2)]
+
+    while stack:
+        base, overrides = stack.pop()
+
+        for k, v in overrides.items():
+            base_value = base.get(k)
+            if isinstance(base_value, dict) and isinstance(v, dict):
+                stack.append((base_value, v))
+            else:
+                base[k] = v
 
 
 def use_style(style_class, style_attr: str = None):
@@ -29,8 +33,9 @@ def use_style(style_class, style_attr: str = None):
             if style and isinstance(style, dict):
                 if style_attr is not None:
                     # if style is a dict and there's a base style, then we just want to merge the changes
-                    base_style = getattr(args[0].style, style_attr).model_dump_json()
-                    base_style = json.loads(base_style)
+                    base_style = getattr(args[0].style, style_attr).model_dump(
+                        mode="json"
+                    )
 
                     merge_dict(base_style, style)
 
@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 from matplotlib.transforms import Bbox
 
 
@@ -132,3 +133,13 @@ def bv_to_hex_color(bv_index):
 def azimuth_to_string(azimuth_degrees: int):
     direction_strings = ["N", "NE", "E", "SE", "S", "SW", "W", "NW", "N"]
     return direction_strings[int(azimuth_degrees / 40)]
+
+
+def apparent_diameter_degrees(radius_km, distance_km):
+    """Calculates the apparent (angular) diameter of a spherical object, in degrees
+
+    Works with single values or numpy arrays.
+
+    Source: https://rhodesmill.org/skyfield/examples.html#what-is-the-angular-diameter-of-a-planet-given-its-radius
+    """
+    return np.degrees(np.arcsin(radius_km / distance_km) * 2.0)
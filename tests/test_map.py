@@ -1,11 +1,14 @@
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 from pytz import timezone
 
+import numpy as np
 import pytest
 
 from starplot import styles
+from starplot.data import stars
 from starplot.map import MapPlot, Projection
 
 from .utils import colorhash, dhash
@@ -18,9 +21,28 @@ STYLE = styles.PlotStyle().extend(
     styles.extensions.BLUE_LIGHT,
     styles.extensions.MAP,
 )
+STYLE_GRAYSCALE = styles.PlotStyle().extend(
+    styles.extensions.GRAYSCALE,
+    styles.extensions.MAP,
+)
 RESOLUTION = 3200
 
 
+@pytest.fixture(scope="module", autouse=True)
+def cached_star_catalogs():
+    """Reads each star catalog from disk only once for all the map tests"""
+    load = lru_cache(maxsize=None)(stars.load)
+
+    with pytest.MonkeyPatch.context() as mp:
+        # return copies, so a test can't change the cached catalog
+        mp.setattr(
+            stars,
+            "load",
+            lambda catalog=stars.StarCatalog.HIPPARCOS: load(catalog).copy(),
+        )
+        yield
+
+
 @pytest.fixture()
 def map_plot_mercator():
     # returns a mercator plot of Orion
@@ -109,6 +131,92 @@ def test_map_plot_stereo_base(map_plot_stereo_north):
     assert colorhash(filename) == "071c0000000"
 
 
+def test_map_plot_dso_markers():
+    filename = DATA_PATH / "map-dso-markers.png"
+
+    p = MapPlot(
+        projection=Projection.MERCATOR,
+        ra_min=3.6,
+        ra_max=7.8,
+        dec_min=-16,
+        dec_max=23.6,
+        style=STYLE,
+        resolution=RESOLUTION,
+    )
+    p.dsos(mag=12, null=True, true_size=False)
+    p.legend()
+    p.export(filename, padding=0.3)
+
+    assert dhash(filename) == "c951ba342b0b74c4"
+    assert colorhash(filename) == "07780000000"
+
+
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        # NGC1973, NGC1975 only have a B-Mag
+        (
+            dict(mag=8),
+            ["NGC1973", "NGC1975", "NGC1976", "NGC1980", "NGC1981"],
+        ),
+        (
+            dict(mag=12),
+            ["NGC1973", "NGC1975", "NGC1976", "NGC1980", "NGC1981", "NGC1999"],
+        ),
+        (
+            dict(mag=12, null=True),
+            [
+                "IC0420",
+                "IC0427",
+                "IC0428",
+                "NGC1973",
+                "NGC1975",
+                "NGC1976",
+                "NGC1977",
+                "NGC1980",
+                "NGC1981",
+                "NGC1999",
+            ],
+        ),
+        # M42
+        (dict(mag=12, null=True, names=["NGC1976"]), ["NGC1976"]),
+        (dict(mag=12, null=True, names=["NGC1976", "O'Neil"]), ["NGC1976"]),
+        (dict(mag=12, null=True, types=[]), []),
+    ],
+)
+def test_map_dsos_filters(kwargs, expected):
+    p = MapPlot(
+        projection=Projection.MERCATOR,
+        ra_min=5.2,
+        ra_max=5.8,
+        dec_min=-7,
+        dec_max=-3,
+        hide_colliding_labels=False,
+        resolution=1000,
+    )
+    p.dsos(true_size=False, **kwargs)
+
+    assert sorted(label.get_text() for label in p.labels) == expected
+    assert sum(len(line.get_xdata()) for line in p.ax.lines) == len(expected)
+    assert list(p._legend_handles) == (["Nebula"] if expected else [])
+    p.close_fig()
+
+
+def test_map_markers_empty():
+    p = MapPlot(
+        projection=Projection.MERCATOR,
+        ra_min=3.6,
+        ra_max=7.8,
+        dec_min=-16,
+        dec_max=23.6,
+        resolution=1000,
+    )
+    lines = len(p.ax.lines)
+    p._markers([], [], p.style.star.marker)
+    assert len(p.ax.lines) == lines
+    p.close_fig()
+
+
 def test_map_plot_with_planets():
     filename = DATA_PATH / "map-mercator-planets.png"
     dt = timezone("UTC").localize(datetime(2023, 8, 27, 23, 0, 0, 0))
@@ -138,11 +246,6 @@ def test_map_plot_scope_bino_fov():
     filename = DATA_PATH / "map-scope-bino-fov.png"
     dt = timezone("UTC").localize(datetime(2023, 8, 27, 23, 0, 0, 0))
 
-    style = styles.PlotStyle().extend(
-        styles.extensions.GRAYSCALE,
-        styles.extensions.MAP,
-    )
-
     p = MapPlot(
         projection=Projection.STEREO_NORTH,
         ra_min=52 / 15,
@@ -150,7 +253,7 @@ def test_map_plot_scope_bino_fov():
         dec_min=20,
         dec_max=28,
         dt=dt,
-        style=style,
+        style=STYLE_GRAYSCALE,
         resolution=1000,
         star_catalog="tycho-1",
     )
@@ -173,10 +276,7 @@ def test_map_plot_scope_bino_fov():
 def test_map_plot_custom_stars():
     filename = DATA_PATH / "map-custom-stars.png"
 
-    style = styles.PlotStyle().extend(
-        styles.extensions.GRAYSCALE,
-        styles.extensions.MAP,
-    )
+    style = STYLE_GRAYSCALE.model_copy(deep=True)
     style.star.marker.symbol = "star_8"
     style.star.marker.size = 60
 
@@ -199,18 +299,13 @@ def test_map_plot_custom_stars():
 def test_map_plot_wrapping():
     filename = DATA_PATH / "map-wrapping.png"
 
-    style = styles.PlotStyle().extend(
-        styles.extensions.GRAYSCALE,
-        styles.extensions.MAP,
-    )
-
     p = MapPlot(
         projection=Projection.STEREO_NORTH,
         ra_min=18,
         ra_max=26,
         dec_min=30,
         dec_max=50,
-        style=style,
+        style=STYLE_GRAYSCALE,
         resolution=RESOLUTION,
     )
     p.stars(mag=9)
@@ -247,14 +342,9 @@ def test_map_radec_invalid():
 def test_map_mollweide():
     filename = DATA_PATH / "map-mollweide.png"
 
-    style = styles.PlotStyle().extend(
-        styles.extensions.GRAYSCALE,
-        styles.extensions.MAP,
-    )
-
     p = MapPlot(
         projection=Projection.MOLLWEIDE,
-        style=style,
+        style=STYLE_GRAYSCALE,
         resolution=RESOLUTION,
     )
     p.stars(mag=4.2, mag_labels=1.8)
@@ -268,5 +358,52 @@ def test_map_mollweide():
     assert colorhash(filename) == "07000000000"
 
 
+def test_map_extent_mask_cache():
+    p = MapPlot(
+        projection=Projection.MERCATOR,
+        ra_min=3.6,
+        ra_max=7.8,
+        dec_min=-16,
+        dec_max=23.6,
+        resolution=1000,
+    )
+    mask = p._extent_mask()
+    assert p._extent_mask() is mask
+
+    p.ra_min = 4
+    p.ra_max = 6
+    new_mask = p._extent_mask()
+
+    assert new_mask is not mask
+    assert new_mask.bounds == (60, p.dec_min, 90, p.dec_max)
+    assert p._extent_mask() is new_mask
+    p.close_fig()
+
+
+@pytest.mark.parametrize(
+    "ra_min,ra_max,dec_min,dec_max",
+    [
+        (3.6, 7.8, -16, 23.6),
+        (18, 26, 30, 50),
+        (0, 24, -90, 90),
+    ],
+)
+def test_map_in_bounds_mask(ra_min, ra_max, dec_min, dec_max):
+    p = MapPlot(
+        projection=Projection.MERCATOR,
+        ra_min=ra_min,
+        ra_max=ra_max,
+        dec_min=dec_min,
+        dec_max=dec_max,
+        resolution=1000,
+    )
+    ras, decs = np.meshgrid(np.linspace(0, 24, 97), np.linspace(-90, 90, 73))
+    ras, decs = ras.ravel(), decs.ravel()
+
+    expected = [p.in_bounds(ra, dec) for ra, dec in zip(ras, decs)]
+    assert p._in_bounds_mask(ras, decs).tolist() == expected
+    p.close_fig()
+
+
 # TODO : Add orthographic
 # TODO : Add Zenith
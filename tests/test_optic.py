@@ -244,6 +244,64 @@ def test_optic_plot_camera_rotated(optic_style, dt_dec_16):
     assert colorhash(filename) == "17000000000"
 
 
+def test_optic_plot_dso_markers_m45(optic_style, dt_dec_16):
+    optic_plot = OpticPlot(
+        # M45
+        ra=3.7836111111,
+        dec=24.1166666667,
+        lat=32.97,
+        lon=-117.038611,
+        optic=optics.Refractor(
+            focal_length=600,
+            eyepiece_focal_length=14,
+            eyepiece_fov=82,
+        ),
+        dt=dt_dec_16,
+        style=optic_style,
+        resolution=1600,
+    )
+    optic_plot.stars(mag=12)
+    optic_plot.dsos(mag=12, null=True, true_size=False)
+    filename = DATA_PATH / "optic-dso-markers-m45.png"
+    optic_plot.export(filename)
+
+    assert dhash(filename) == "0e3369455149330e"
+    assert colorhash(filename) == "3a000000000"
+
+
+def test_optic_plot_dso_markers_in_bounds(dt_dec_16):
+    optic_plot = OpticPlot(
+        # M45
+        ra=3.7836111111,
+        dec=24.1166666667,
+        lat=32.97,
+        lon=-117.038611,
+        optic=optics.Refractor(
+            focal_length=600,
+            eyepiece_focal_length=14,
+            eyepiece_fov=82,
+        ),
+        dt=dt_dec_16,
+        hide_colliding_labels=False,
+        resolution=800,
+    )
+    lines = len(optic_plot.ax.lines)
+    # IC0354 is in the extent of the plot, but outside the field of view
+    optic_plot.dsos(
+        mag=12,
+        null=True,
+        true_size=False,
+        names=["IC0354", "Mel022", "NGC1435"],
+    )
+
+    assert sum(len(line.get_xdata()) for line in optic_plot.ax.lines[lines:]) == 2
+    assert sorted(label.get_text() for label in optic_plot.labels) == [
+        "Mel022",
+        "NGC1435",
+    ]
+    optic_plot.close_fig()
+
+
 def test_optic_plot_raises_fov_too_big():
     with pytest.raises(ValueError, match=r"Field of View too big"):
         OpticPlot(
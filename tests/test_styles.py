@@ -4,6 +4,7 @@ from pydantic import ValidationError
 from pydantic.color import Color
 
 from starplot.styles import PlotStyle, FontWeightEnum, LineStyle, LineStyleEnum
+from starplot.styles.helpers import merge_dict
 
 
 @pytest.mark.parametrize(
@@ -43,3 +44,22 @@ def test_plot_style_invalid(kwargs):
 def test_style_enums_use_strings():
     line_style = LineStyle(style=LineStyleEnum.DASHED)
     assert line_style.style == "dashed"
+
+
+def test_merge_dict_nested():
+    base = {
+        "star": {"marker": {"color": "#000", "size": 20}, "label": {"font_size": 9}},
+        "title": "hello",
+    }
+    merge_dict(
+        base,
+        {
+            "star": {"marker": {"size": 30}, "label": None},
+            "legend": {"location": "lower right"},
+        },
+    )
+    assert base == {
+        "star": {"marker": {"color": "#000", "size": 30}, "label": None},
+        "title": "hello",
+        "legend": {"location": "lower right"},
+    }
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from starplot.utils import in_circle, dec_str_to_float
+from starplot.utils import in_circle, dec_str_to_float, apparent_diameter_degrees
 
 
 @pytest.mark.parametrize(
@@ -27,3 +28,12 @@ def test_in_circle(x, y, expected):
 )
 def test_dec_str_to_float(dms, expected):
     assert dec_str_to_float(dms) == expected
+
+
+def test_apparent_diameter_degrees():
+    # the moon at 384,400 km
+    assert round(apparent_diameter_degrees(1_740, 384_400), 4) == 0.5187
+
+    diameters = apparent_diameter_degrees(np.array([1_740, 3_480]), 384_400)
+    assert diameters.shape == (2,)
+    assert diameters[1] > diameters[0]